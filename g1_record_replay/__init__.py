@@ -3,7 +3,22 @@
 __version__ = "0.1.0"
 
 from .core import G1Interface, DataManager, G1JointIndex, JOINT_NAMES, JOINT_GROUPS
-from .safety import SafetyChecker, check_and_disable_fsm
+
+# Safety helpers pull in rich (console UI), so import them on first access;
+# data-only users such as episode visualization never pay for it
+_LAZY_EXPORTS = {
+    'SafetyChecker': '.safety',
+    'check_and_disable_fsm': '.safety',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        from importlib import import_module
+        value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     'G1Interface',
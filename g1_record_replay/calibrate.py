@@ -1,12 +1,16 @@
 """Calibration Mode - Discover and save joint limits"""
 
+import io
+import os
 import time
 import numpy as np
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, TextIO
 import sys
-import select
+import termios
+import traceback
+import tty
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.live import Live
 from rich.panel import Panel
@@ -15,6 +19,60 @@ from rich.layout import Layout
 from .core import G1Interface, JOINT_NAMES, DataManager
 
 
+# Column schema of the calibration table: (header, add_column kwargs)
+_TABLE_COLUMNS = (
+    ("Index", {"justify": "right", "style": "cyan"}),
+    ("Joint Name", {"style": "magenta"}),
+    ("Current", {"justify": "right", "style": "white"}),
+    ("Min", {"justify": "right", "style": "green"}),
+    ("Max", {"justify": "right", "style": "red"}),
+    ("Range", {"justify": "right", "style": "yellow"}),
+)
+
+
+class _SynchronizedOutput(io.TextIOBase):
+    """
+    Stream wrapper that paints each flushed frame atomically.
+    
+    Rich emits a frame as several writes; these are buffered and written in one
+    go on flush, wrapped in DEC mode 2026 (synchronized output) markers when the
+    target is a terminal, so the display doesn't flicker on slow terminals.
+    """
+    
+    BEGIN_SYNC = "\x1b[?2026h"
+    END_SYNC = "\x1b[?2026l"
+    
+    def __init__(self, stream: TextIO):
+        self._stream = stream
+        self._buffer = io.StringIO()
+    
+    @property
+    def encoding(self) -> str:
+        return getattr(self._stream, 'encoding', 'utf-8')
+    
+    def isatty(self) -> bool:
+        return self._stream.isatty()
+    
+    def fileno(self) -> int:
+        return self._stream.fileno()
+    
+    def writable(self) -> bool:
+        return True
+    
+    def write(self, text: str) -> int:
+        return self._buffer.write(text)
+    
+    def flush(self):
+        text = self._buffer.getvalue()
+        if text:
+            self._buffer.seek(0)
+            self._buffer.truncate()
+            if self.isatty():
+                text = f"{self.BEGIN_SYNC}{text}{self.END_SYNC}"
+            self._stream.write(text)
+        self._stream.flush()
+
+
 class Calibrator:
     """Handles joint calibration with live display"""
     
@@ -29,7 +87,7 @@ class Calibrator:
         """
         self.interface = interface
         self.data_manager = data_manager
-        self.console = Console()
+        self.console = Console(file=_SynchronizedOutput(sys.stdout))
         
         # Joint groups (indices)
         self.joint_groups = {
@@ -43,81 +101,96 @@ class Calibrator:
             raise ValueError(f"Invalid joint group: {joint_group}. Choose from {list(self.joint_groups.keys())}")
         
         self.active_joints = self.joint_groups[joint_group]
+        self._active_idx = np.asarray(self.active_joints, dtype=np.intp)
         self.joint_group = joint_group
         
-        # Calibration data
-        self.min_positions = np.full(29, np.inf)
-        self.max_positions = np.full(29, -np.inf)
-        self.current_positions = np.zeros(29)
+        # Static parts of the display table, formatted once
+        self._table_title = f"Joint Calibration - {joint_group.upper()}"
+        self._static_cols = [(str(i), JOINT_NAMES[i]) for i in self.active_joints]
+        
+        # Calibration data (float32 buffers, reused across frames)
+        self.min_positions = np.full(29, np.inf, dtype=np.float32)
+        self.max_positions = np.full(29, -np.inf, dtype=np.float32)
+        self.current_positions = np.zeros(29, dtype=np.float32)
         
         self.running = False
-        self.start_time = None
+        self._start_ns = None
+        self._last_change_t = 0.0
+        self._stdin_fd = None
     
     def reset_limits(self):
         """Reset min/max limits"""
-        self.min_positions = np.full(29, np.inf)
-        self.max_positions = np.full(29, -np.inf)
+        self.min_positions.fill(np.inf)
+        self.max_positions.fill(-np.inf)
         self.console.print("[yellow]Limits reset[/yellow]")
     
-    def _update_calibration(self):
-        """Update calibration data from current state"""
-        state = self.interface.get_joint_state()
-        if state is None:
-            return
+    def _update_calibration(self) -> bool:
+        """
+        Update calibration data from current state.
         
-        self.current_positions = state.positions
+        Returns:
+            True if any min/max limit changed, False otherwise
+        """
+        if not self.interface.get_joint_positions_into(self.current_positions):
+            return False
         
         # Update min/max for active joints
-        for idx in self.active_joints:
-            pos = state.positions[idx]
-            if pos < self.min_positions[idx]:
-                self.min_positions[idx] = pos
-            if pos > self.max_positions[idx]:
-                self.max_positions[idx] = pos
+        idx = self._active_idx
+        pos = self.current_positions[idx]
+        old_min = self.min_positions[idx]
+        old_max = self.max_positions[idx]
+        
+        changed = bool((pos < old_min).any() or (pos > old_max).any())
+        if changed:
+            self._last_change_t = time.monotonic()
+            self.min_positions[idx] = np.fmin(old_min, pos)
+            self.max_positions[idx] = np.fmax(old_max, pos)
+        
+        return changed
     
     def _create_display_table(self) -> Table:
         """Create display table for calibration data"""
-        table = Table(title=f"Joint Calibration - {self.joint_group.upper()}", show_header=True)
+        table = Table(title=self._table_title, show_header=True)
+        for header, column_kwargs in _TABLE_COLUMNS:
+            table.add_column(header, **column_kwargs)
         
-        table.add_column("Index", justify="right", style="cyan")
-        table.add_column("Joint Name", style="magenta")
-        table.add_column("Current", justify="right", style="white")
-        table.add_column("Min", justify="right", style="green")
-        table.add_column("Max", justify="right", style="red")
-        table.add_column("Range", justify="right", style="yellow")
+        # Compute masks and ranges once over the active slice, then format
+        # plain Python floats so no per-cell NumPy calls are made
+        idx = self._active_idx
+        min_vals = self.min_positions[idx]
+        max_vals = self.max_positions[idx]
+        min_ok = np.isfinite(min_vals)
+        max_ok = np.isfinite(max_vals)
+        range_ok = min_ok & max_ok
+        with np.errstate(invalid='ignore'):
+            ranges = np.where(range_ok, max_vals - min_vals, np.nan)
         
-        for idx in self.active_joints:
-            joint_name = JOINT_NAMES[idx]
-            current = self.current_positions[idx]
-            min_val = self.min_positions[idx]
-            max_val = self.max_positions[idx]
-            
-            # Calculate range
-            if np.isfinite(min_val) and np.isfinite(max_val):
-                range_val = max_val - min_val
-                range_str = f"{range_val:.3f}"
-            else:
-                range_str = "---"
-            
-            # Format values
-            current_str = f"{current:.3f}"
-            min_str = f"{min_val:.3f}" if np.isfinite(min_val) else "---"
-            max_str = f"{max_val:.3f}" if np.isfinite(max_val) else "---"
-            
+        rows = zip(self._static_cols,
+                   self.current_positions[idx].tolist(),
+                   min_vals.tolist(), max_vals.tolist(), ranges.tolist(),
+                   min_ok.tolist(), max_ok.tolist(), range_ok.tolist())
+        
+        for (index_str, joint_name), current, min_val, max_val, range_val, has_min, has_max, has_range in rows:
             table.add_row(
-                str(idx),
+                index_str,
                 joint_name,
-                current_str,
-                min_str,
-                max_str,
-                range_str
+                f"{current:.3f}",
+                f"{min_val:.3f}" if has_min else "---",
+                f"{max_val:.3f}" if has_max else "---",
+                f"{range_val:.3f}" if has_range else "---",
             )
         
         return table
     
+    def _elapsed_ds(self) -> int:
+        """Elapsed calibration time in tenths of a second (monotonic, integer math)"""
+        if self._start_ns is None:
+            return 0
+        return (time.monotonic_ns() - self._start_ns) // 100_000_000
+    
     def _create_display_panel(self) -> Panel:
         """Create display panel with table and instructions"""
-        elapsed = time.time() - self.start_time if self.start_time else 0
+        elapsed_ds = self._elapsed_ds()
         
         # Create layout
         table = self._create_display_table()
@@ -128,20 +201,25 @@ class Calibrator:
             "• Press [bold]R[/bold] to reset min/max values\n"
             "• Press [bold]S[/bold] to save calibration and exit\n"
             "• Press [bold]Q[/bold] to quit without saving\n\n"
-            f"[dim]Elapsed time: {elapsed:.1f}s[/dim]"
+            f"[dim]Elapsed time: {elapsed_ds // 10}.{elapsed_ds % 10}s[/dim]"
         )
         
         return Panel(
-            f"{table}\n\n{instructions}",
+            Group(table, "", instructions),
             title="[bold]G1 Calibration Mode[/bold]",
             border_style="blue"
         )
     
     def _check_keyboard_input(self) -> Optional[str]:
-        """Check for keyboard input (non-blocking)"""
-        if sys.stdin in select.select([sys.stdin], [], [], 0)[0]:
-            line = sys.stdin.read(1)
-            return line.lower()
+        """
+        Check for keyboard input (non-blocking).
+        
+        Relies on run() putting the terminal in VMIN=0/VTIME=0 mode, so a
+        single read returns immediately with no data when no key is pending.
+        """
+        data = os.read(self._stdin_fd, 1)
+        if data:
+            return data.decode(errors='ignore').lower()
         return None
     
     def run(self):
@@ -150,23 +228,32 @@ class Calibrator:
         self.console.print("[yellow]Move joints to their limits. The system will record min/max positions.[/yellow]\n")
         
         self.running = True
-        self.start_time = time.time()
+        self._start_ns = time.monotonic_ns()
         
         # Set terminal to non-blocking mode
-        import tty
-        import termios
         old_settings = termios.tcgetattr(sys.stdin)
         
         try:
-            tty.setcbreak(sys.stdin.fileno())
+            self._stdin_fd = sys.stdin.fileno()
+            tty.setcbreak(self._stdin_fd)
             
-            with Live(self._create_display_panel(), refresh_per_second=10, console=self.console) as live:
+            # Make reads return immediately instead of polling with select().
+            # Done at the tty level rather than with O_NONBLOCK, which would also
+            # affect stdout when it shares the terminal's file description.
+            attrs = termios.tcgetattr(self._stdin_fd)
+            attrs[6][termios.VMIN] = 0
+            attrs[6][termios.VTIME] = 0
+            termios.tcsetattr(self._stdin_fd, termios.TCSANOW, attrs)
+            
+            # Redraws are driven by the dirty flag below rather than Rich's refresh thread
+            with Live(self._create_display_panel(), refresh_per_second=20, auto_refresh=False,
+                      console=self.console) as live:
+                last_elapsed_ds = 0
+                last_redraw_t = 0.0
+                
                 while self.running:
                     # Update calibration data
-                    self._update_calibration()
-                    
-                    # Update display
-                    live.update(self._create_display_panel())
+                    changed = self._update_calibration()
                     
                     # Check for keyboard input
                     key = self._check_keyboard_input()
@@ -179,11 +266,28 @@ class Calibrator:
                         self.console.print("[yellow]Quitting without saving...[/yellow]")
                         self.running = False
                     
-                    time.sleep(0.05)  # 20Hz update
+                    now = time.monotonic()
+                    if key is not None:
+                        self._last_change_t = now
+                    
+                    # Only redraw when limits moved, a key was pressed, or the clock ticked;
+                    # once idle for 1s, redraws are throttled to 4Hz
+                    elapsed_ds = self._elapsed_ds()
+                    dirty = changed or key is not None or elapsed_ds != last_elapsed_ds
+                    idle = (now - self._last_change_t) >= 1.0
+                    if dirty and (not idle or now - last_redraw_t >= 0.25):
+                        live.update(self._create_display_panel(), refresh=True)
+                        last_elapsed_ds = elapsed_ds
+                        last_redraw_t = now
+                    
+                    # Sampling and key polling always run at 20Hz, so brief
+                    # excursions to a limit are recorded even when idle
+                    time.sleep(0.05)
         
         finally:
             # Restore terminal settings
             termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
+            self.console.show_cursor(True)
             self.console.print("\n[bold green]Calibration mode ended[/bold green]")
     
     def _save_calibration(self):
@@ -248,7 +352,6 @@ def run_calibration(network_interface: Optional[str] = None, joint_group: str =
         console.print("\n[yellow]Interrupted by user[/yellow]")
     except Exception as e:
         console.print(f"[bold red]Error: {e}[/bold red]")
-        import traceback
         traceback.print_exc()
     finally:
         if 'interface' in locals():
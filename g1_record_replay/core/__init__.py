@@ -1,7 +1,7 @@
 """Core functionality for G1 robot control and data management"""
 
 from .g1_interface import G1Interface, G1JointIndex, JOINT_NAMES, JOINT_GROUPS, get_joint_indices
-from .data_manager import DataManager
+from .data_manager import DataManager, EpisodeWriter
 
-__all__ = ["G1Interface", "G1JointIndex", "JOINT_NAMES", "JOINT_GROUPS", "get_joint_indices", "DataManager"]
+__all__ = ["G1Interface", "G1JointIndex", "JOINT_NAMES", "JOINT_GROUPS", "get_joint_indices", "DataManager", "EpisodeWriter"]
 
@@ -1,12 +1,401 @@
 """Data Manager - Handle episode storage and loading"""
 
 import os
+import re
 import json
 import h5py
+import hdf5plugin
 import numpy as np
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable, Iterator, Union
 from pathlib import Path
+from contextlib import contextmanager
+
+# orjson is optional; it serializes calibration/index files much faster than json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Blosc+Zstd with byte-shuffle: much faster than gzip on smooth trajectory data
+# at a comparable ratio. Reading these files requires hdf5plugin to be imported.
+_TRAJECTORY_COMPRESSION = hdf5plugin.Blosc(cname='zstd', clevel=1, shuffle=hdf5plugin.Blosc.SHUFFLE)
+_TRAJECTORY_CHUNK_FRAMES = 4096
+
+# Frames compared per NumPy call when scanning stationary runs for drift;
+# the window doubles while no drift is found
+_RLE_MIN_SCAN_WINDOW = 16
+_RLE_MAX_SCAN_WINDOW = 4096
+
+# Metadata keys also stored as individual HDF5 attributes
+_NATIVE_METADATA_KEYS = ("episode_id", "num_frames", "duration")
+
+# Episode name sanitizing: keep alphanumerics, '-' and '_', replace everything else
+_SAFE_NAME_TABLE = str.maketrans({c: '_' for c in map(chr, range(256)) if not (c.isalnum() or c in '-_')})
+_UNSAFE_NAME_RE = re.compile(r'[^\w\-]')
+
+# Sidecar index of episode summaries, so listing doesn't open every HDF5 file
+_INDEX_FILENAME = "_index.json"
+_INDEX_LOCK_FILENAME = "_index.lock"
+
+
+def _sanitize_name(name: str) -> str:
+    """Make an episode name safe for use in a filename"""
+    if name.isascii():
+        return name.translate(_SAFE_NAME_TABLE)
+    return _UNSAFE_NAME_RE.sub('_', name)
+
+
+def _json_default(value: Any) -> Any:
+    """JSON fallback for NumPy scalars/arrays and other non-JSON metadata values"""
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    return str(value)
+
+
+def _dump_json(data: Any, indent: bool = False) -> bytes:
+    """Serialize data to JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, default=_json_default, option=option)
+    return json.dumps(data, default=_json_default, indent=2 if indent else None).encode()
+
+
+def _load_json(raw: Union[bytes, str]) -> Any:
+    """Parse JSON bytes or text, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _write_atomic(path: Path, data: bytes):
+    """Write bytes to a sibling temp file, then rename it over path"""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _stationary_keep_indices(positions: np.ndarray, eps: float) -> np.ndarray:
+    """
+    Indices of frames to keep when run-length encoding stationary stretches.
+    
+    A frame is kept when any joint moved more than eps from its predecessor
+    or from the last kept frame, so slow drift below eps per frame still gets
+    recorded. The first and last frames are always kept.
+    """
+    # Frames that moved more than eps from their predecessor are always kept;
+    # only the stationary runs in between need the sequential scan.
+    step = np.max(np.abs(np.diff(positions, axis=0)), axis=1)
+    moved = np.concatenate(([True], step > eps))
+    
+    edges = np.diff(np.concatenate(([0], (~moved).view(np.int8), [0])))
+    run_starts = np.flatnonzero(edges == 1)
+    run_ends = np.flatnonzero(edges == -1)
+    
+    drifted = []
+    for start, end in zip(run_starts, run_ends):
+        # The frame before a run moved, so it is kept and anchors the scan
+        anchor = positions[start - 1]
+        size = _RLE_MIN_SCAN_WINDOW
+        i = start
+        while i < end:
+            window = positions[i:min(end, i + size)]
+            over = np.flatnonzero(np.max(np.abs(window - anchor), axis=1) > eps)
+            if over.size == 0:
+                i += len(window)
+                size = min(size * 2, _RLE_MAX_SCAN_WINDOW)
+                continue
+            i += over[0]
+            drifted.append(i)
+            anchor = positions[i]
+            size = _RLE_MIN_SCAN_WINDOW
+            i += 1
+    
+    keep = np.flatnonzero(moved)
+    if drifted:
+        keep = np.union1d(keep, drifted)
+    if keep[-1] != len(positions) - 1:
+        keep = np.append(keep, len(positions) - 1)
+    
+    return keep.astype(np.int32)
+
+
+def _file_stat(filepath: Path) -> Optional[List[int]]:
+    """[mtime_ns, size] of a file, used to spot stale index entries; None if it can't be stat'ed"""
+    try:
+        st = filepath.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _episode_summary(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract the fields shown by list_episodes from episode metadata"""
+    summary = {
+        'episode_id': metadata.get('episode_id', 'unknown'),
+        'num_frames': metadata.get('num_frames', 0),
+        'duration': metadata.get('duration', 0.0),
+        'frequency': metadata.get('frequency', 0.0),
+        'timestamp': metadata.get('timestamp', 'unknown'),
+    }
+    
+    # Add description if available
+    if 'description' in metadata:
+        summary['description'] = metadata['description']
+    
+    return summary
+
+
+def _read_metadata(f: h5py.File) -> Dict[str, Any]:
+    """Read episode metadata, preferring the JSON attribute over per-key attributes"""
+    if 'metadata_json' in f.attrs:
+        return _load_json(f.attrs['metadata_json'])
+    
+    # Episodes saved before metadata_json was introduced
+    metadata = {}
+    for key in f.attrs.keys():
+        metadata[key] = f.attrs[key]
+    return metadata
+
+
+class EpisodeWriter:
+    """
+    Streams episode frames into a resizable HDF5 file.
+    
+    Frames are buffered in a fixed-size local chunk and appended to the
+    datasets whenever the chunk fills, so memory use stays O(chunk_frames)
+    regardless of recording length. Metadata is written on close; if the
+    with-block raises, the partial file is deleted instead.
+    
+    Usage:
+        with data_manager.open_episode_writer(episode_name="wave") as writer:
+            writer.append(positions, timestamp, velocities)
+    """
+    
+    def __init__(self, filepath: Path, episode_id: str,
+                 num_joints: int = 29,
+                 with_velocities: bool = True,
+                 metadata: Optional[Dict[str, Any]] = None,
+                 chunk_frames: int = 1024,
+                 on_close: Optional[Callable[[Path, Dict[str, Any]], None]] = None,
+                 in_memory: bool = False,
+                 created_at: Optional[datetime] = None):
+        """
+        Initialize episode writer.
+        
+        Args:
+            filepath: Path of the HDF5 file to create
+            episode_id: Episode ID stored in the metadata
+            num_joints: Number of joints per frame
+            with_velocities: Whether a joint_velocities dataset is written
+            metadata: Dictionary of metadata (description, operator, etc.)
+            chunk_frames: Frames per HDF5 chunk and local buffer size
+            on_close: Called with (filepath, full metadata) once the file is written
+            in_memory: Build the file image in memory and write it to disk in one
+                       pass on close (HDF5 core driver). Suited to bulk saves of
+                       data that is already in RAM, not to long streaming sessions.
+            created_at: Creation time stored in the metadata (defaults to now)
+        """
+        self.filepath = Path(filepath)
+        self.episode_id = episode_id
+        self.num_joints = num_joints
+        self.with_velocities = with_velocities
+        self.metadata = metadata
+        self.chunk_frames = max(1, chunk_frames)
+        self.on_close = on_close
+        self.in_memory = in_memory
+        self.created_at = created_at or datetime.now()
+        
+        self.num_frames = 0
+        self.first_timestamp = None
+        self.last_timestamp = None
+        
+        self._file = None
+        self._buffered = 0
+        self._pos_buf = np.empty((self.chunk_frames, num_joints), dtype=np.float32)
+        self._vel_buf = np.zeros((self.chunk_frames, num_joints), dtype=np.float32) if with_velocities else None
+        self._ts_buf = np.empty(self.chunk_frames, dtype=np.float64)
+    
+    @property
+    def duration(self) -> float:
+        """Time between the first and last frame in seconds"""
+        if self.num_frames > 1:
+            return float(self.last_timestamp - self.first_timestamp)
+        return 0.0
+    
+    @property
+    def frequency(self) -> float:
+        """Average recording frequency in Hz"""
+        duration = self.duration
+        return self.num_frames / duration if duration > 0 else 0.0
+    
+    def __enter__(self) -> 'EpisodeWriter':
+        self.open()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        # A failed write leaves a truncated episode; don't keep or index it
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+    
+    def open(self):
+        """Create the HDF5 file and empty resizable datasets"""
+        if self.in_memory:
+            self._file = h5py.File(self.filepath, 'w', driver='core', backing_store=True)
+        else:
+            self._file = h5py.File(self.filepath, 'w')
+        self._file.create_dataset('timestamps', shape=(0,), maxshape=(None,), dtype=np.float64,
+                                  chunks=(self.chunk_frames,), **_TRAJECTORY_COMPRESSION)
+        
+        # Trajectories are stored per joint (one 1-D dataset per joint in a group),
+        # so the codec sees each joint's smooth time series instead of interleaved rows
+        names = ['joint_positions', 'joint_velocities'] if self.with_velocities else ['joint_positions']
+        for name in names:
+            group = self._file.create_group(name)
+            for j in range(self.num_joints):
+                group.create_dataset(str(j), shape=(0,), maxshape=(None,), dtype=np.float32,
+                                     chunks=(self.chunk_frames,), **_TRAJECTORY_COMPRESSION)
+    
+    def append(self, positions: np.ndarray, timestamp: float,
+               velocities: Optional[np.ndarray] = None):
+        """
+        Append a single frame.
+        
+        Args:
+            positions: Joint positions (num_joints,)
+            timestamp: Frame timestamp in seconds
+            velocities: Joint velocities (num_joints,), optional
+        """
+        i = self._buffered
+        self._pos_buf[i] = positions
+        self._ts_buf[i] = timestamp
+        if self._vel_buf is not None and velocities is not None:
+            self._vel_buf[i] = velocities
+        self._buffered = i + 1
+        
+        if self.first_timestamp is None:
+            self.first_timestamp = timestamp
+        self.last_timestamp = timestamp
+        self.num_frames += 1
+        
+        if self._buffered == self.chunk_frames:
+            self.flush()
+    
+    def extend(self, positions: np.ndarray, timestamps: np.ndarray,
+               velocities: Optional[np.ndarray] = None):
+        """
+        Append a block of frames in one write.
+        
+        Args:
+            positions: Joint positions (n, num_joints)
+            timestamps: Timestamps (n,)
+            velocities: Joint velocities (n, num_joints), optional
+        """
+        n = len(timestamps)
+        if n == 0:
+            return
+        
+        self.flush()
+        self._write(positions, timestamps, velocities)
+        
+        if self.first_timestamp is None:
+            self.first_timestamp = timestamps[0]
+        self.last_timestamp = timestamps[-1]
+        self.num_frames += n
+    
+    def flush(self):
+        """Write buffered frames to the file"""
+        n = self._buffered
+        if n == 0:
+            return
+        
+        velocities = self._vel_buf[:n] if self._vel_buf is not None else None
+        self._write(self._pos_buf[:n], self._ts_buf[:n], velocities)
+        self._buffered = 0
+        if self._vel_buf is not None:
+            self._vel_buf.fill(0.0)
+    
+    def write_dataset(self, name: str, data: np.ndarray):
+        """
+        Write an additional, fully materialized 1-D dataset alongside the streamed ones.
+        
+        Args:
+            name: Dataset name; a path like "group/name" creates the group
+            data: Data to store
+        """
+        chunks = (max(1, min(_TRAJECTORY_CHUNK_FRAMES, len(data))),)
+        self._file.create_dataset(name, data=data, chunks=chunks, **_TRAJECTORY_COMPRESSION)
+    
+    def _write(self, positions: np.ndarray, timestamps: np.ndarray,
+               velocities: Optional[np.ndarray]):
+        """Grow the datasets and write a block of frames at the end"""
+        n = len(timestamps)
+        dataset = self._file['timestamps']
+        start = dataset.shape[0]
+        end = start + n
+        
+        dataset.resize(end, axis=0)
+        dataset[start:end] = timestamps
+        
+        for name, data in (('joint_positions', positions), ('joint_velocities', velocities)):
+            if name not in self._file:
+                continue
+            group = self._file[name]
+            for j in range(self.num_joints):
+                dataset = group[str(j)]
+                dataset.resize(end, axis=0)
+                if data is not None:
+                    dataset[start:end] = data[:, j]
+    
+    def close(self):
+        """Flush remaining frames, write metadata attributes and close the file"""
+        if self._file is None:
+            return
+        
+        try:
+            self.flush()
+            
+            full_metadata = {
+                "episode_id": self.episode_id,
+                "timestamp": self.created_at.isoformat(),
+                "num_frames": self.num_frames,
+                "duration": self.duration,
+                "frequency": float(self.frequency),
+                "num_joints": self.num_joints,
+                "positions_dtype": "float32",
+            }
+            
+            if self.metadata:
+                full_metadata.update(self.metadata)
+            
+            # Store metadata as one JSON attribute, plus a few native
+            # attributes for tools that filter episodes without parsing JSON
+            attrs = self._file.attrs
+            attrs['metadata_json'] = _dump_json(full_metadata).decode()
+            for key in _NATIVE_METADATA_KEYS:
+                attrs[key] = full_metadata[key]
+        finally:
+            self._file.close()
+            self._file = None
+        
+        if self.on_close is not None:
+            self.on_close(self.filepath, full_metadata)
+    
+    def abort(self):
+        """Close the file without writing metadata or indexing it, and delete it"""
+        if self._file is None:
+            return
+        
+        try:
+            self._file.close()
+        finally:
+            self._file = None
+            self.filepath.unlink(missing_ok=True)
 
 
 class DataManager:
@@ -22,6 +411,42 @@ class DataManager:
         self.episodes_dir = Path(episodes_dir)
         self.episodes_dir.mkdir(parents=True, exist_ok=True)
     
+    def _make_episode_id(self, now: datetime, episode_name: Optional[str] = None) -> str:
+        """Generate an episode ID timestamped with `now` from an optional name"""
+        stamp = now.strftime('%Y%m%d_%H%M%S')
+        if episode_name:
+            return f"{stamp}_{_sanitize_name(episode_name)}"
+        return f"episode_{stamp}"
+    
+    def open_episode_writer(self,
+                            metadata: Optional[Dict[str, Any]] = None,
+                            episode_name: Optional[str] = None,
+                            num_joints: int = 29,
+                            with_velocities: bool = True,
+                            chunk_frames: int = 1024,
+                            in_memory: bool = False) -> EpisodeWriter:
+        """
+        Create a streaming writer for a new episode.
+        
+        Args:
+            metadata: Dictionary of metadata (description, operator, etc.)
+            episode_name: Name for the episode (auto-generated if None)
+            num_joints: Number of joints per frame
+            with_velocities: Whether to store joint velocities
+            chunk_frames: Frames buffered in memory before each write
+            in_memory: Assemble the whole file in memory and write it on close
+            
+        Returns:
+            EpisodeWriter to be used as a context manager
+        """
+        now = datetime.now()
+        episode_id = self._make_episode_id(now, episode_name)
+        filepath = self.episodes_dir / f"{episode_id}.h5"
+        return EpisodeWriter(filepath, episode_id, num_joints=num_joints,
+                             with_velocities=with_velocities, metadata=metadata,
+                             chunk_frames=chunk_frames, on_close=self._index_episode,
+                             in_memory=in_memory, created_at=now)
+    
     def save_episode(self,
                     joint_positions: np.ndarray,
                     timestamps: np.ndarray,
@@ -32,25 +457,20 @@ class DataManager:
         Save episode data to HDF5 file.
         
         Args:
-            joint_positions: Joint positions array (num_frames, 29)
+            joint_positions: Joint positions array (num_frames, 29), stored as float32
             timestamps: Timestamps array (num_frames,)
-            joint_velocities: Joint velocities array (num_frames, 29), optional
-            metadata: Dictionary of metadata (description, operator, etc.)
+            joint_velocities: Joint velocities array (num_frames, 29), optional, stored as float32
+            metadata: Dictionary of metadata (description, operator, etc.).
+                      If it contains 'rle_eps' > 0, stationary frames whose
+                      positions stay within rle_eps (radians, max-abs) of the
+                      last kept frame are dropped and restored on load.
+                      Only positions are run-length encoded; velocities are
+                      still stored for every frame.
             episode_name: Name for the episode (auto-generated if None)
             
         Returns:
             Path to saved episode file
         """
-        # Generate episode ID and filename
-        if episode_name:
-            # Sanitize episode name
-            safe_name = "".join(c if c.isalnum() or c in ('-', '_') else '_' for c in episode_name)
-            episode_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{safe_name}"
-        else:
-            episode_id = f"episode_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        
-        filepath = self.episodes_dir / f"{episode_id}.h5"
-        
         # Validate data shapes
         num_frames = len(timestamps)
         if joint_positions.shape[0] != num_frames:
@@ -58,40 +478,53 @@ class DataManager:
         if joint_velocities is not None and joint_velocities.shape[0] != num_frames:
             raise ValueError(f"Velocity frames ({joint_velocities.shape[0]}) != timestamps ({num_frames})")
         
-        # Calculate statistics
-        duration = timestamps[-1] - timestamps[0] if len(timestamps) > 1 else 0.0
-        avg_frequency = num_frames / duration if duration > 0 else 0.0
+        # Joint radians only need ~1 mrad precision, so store trajectories as float32.
+        # Timestamps stay float64 to keep monotonic clock precision.
+        joint_positions = np.ascontiguousarray(joint_positions, dtype=np.float32)
+        if joint_velocities is not None:
+            joint_velocities = np.ascontiguousarray(joint_velocities, dtype=np.float32)
         
-        # Prepare metadata
-        full_metadata = {
-            "episode_id": episode_id,
-            "timestamp": datetime.now().isoformat(),
-            "num_frames": num_frames,
-            "duration": float(duration),
-            "frequency": float(avg_frequency),
-            "num_joints": joint_positions.shape[1],
-        }
+        # Optionally run-length encode stationary stretches
+        rle_eps = float(metadata.get('rle_eps', 0.0)) if metadata else 0.0
+        keep = None
+        if rle_eps > 0 and num_frames > 1:
+            keep = _stationary_keep_indices(joint_positions, rle_eps)
+            metadata = dict(metadata)
+            metadata['rle_kept_frames'] = len(keep)
+            # Counted over the full episode, not just the kept frames
+            metadata['num_frames'] = num_frames
+            duration = float(timestamps[-1] - timestamps[0])
+            metadata['frequency'] = num_frames / duration if duration > 0 else 0.0
         
-        if metadata:
-            full_metadata.update(metadata)
+        writer = self.open_episode_writer(
+            metadata=metadata,
+            episode_name=episode_name,
+            num_joints=joint_positions.shape[1],
+            # Run-length encoded episodes write full-length velocities separately
+            with_velocities=joint_velocities is not None and keep is None,
+            chunk_frames=min(_TRAJECTORY_CHUNK_FRAMES, num_frames),
+            # The data is already in RAM, so write the file image in one pass
+            in_memory=True,
+        )
+        with writer:
+            if keep is None:
+                writer.extend(joint_positions, timestamps, joint_velocities)
+            else:
+                writer.extend(joint_positions[keep], timestamps[keep])
+                if joint_velocities is not None:
+                    for j in range(joint_velocities.shape[1]):
+                        writer.write_dataset(f'joint_velocities/{j}', joint_velocities[:, j])
+                writer.write_dataset('rle_keep_indices', keep)
+                writer.write_dataset('rle_frame_timestamps', timestamps)
         
-        # Save to HDF5
-        with h5py.File(filepath, 'w') as f:
-            # Store data arrays
-            f.create_dataset('joint_positions', data=joint_positions, compression='gzip')
-            f.create_dataset('timestamps', data=timestamps, compression='gzip')
-            
-            if joint_velocities is not None:
-                f.create_dataset('joint_velocities', data=joint_velocities, compression='gzip')
-            
-            # Store metadata as attributes
-            for key, value in full_metadata.items():
-                f.attrs[key] = value
-        
-        print(f"Episode saved: {filepath}")
+        duration = writer.duration
+        avg_frequency = num_frames / duration if duration > 0 else 0.0
+        print(f"Episode saved: {writer.filepath}")
         print(f"  Frames: {num_frames}, Duration: {duration:.2f}s, Freq: {avg_frequency:.1f}Hz")
+        if keep is not None:
+            print(f"  Stationary frames dropped: {num_frames - len(keep)}")
         
-        return str(filepath)
+        return str(writer.filepath)
     
     def load_episode(self, filepath: str) -> Dict[str, Any]:
         """
@@ -102,9 +535,9 @@ class DataManager:
             
         Returns:
             Dictionary containing:
-                - joint_positions: (num_frames, 29) array
-                - timestamps: (num_frames,) array
-                - joint_velocities: (num_frames, 29) array (if available)
+                - joint_positions: (num_frames, 29) float32 array
+                - timestamps: (num_frames,) float64 array
+                - joint_velocities: (num_frames, 29) float32 array (if available)
                 - metadata: dict of metadata
         """
         filepath = Path(filepath)
@@ -114,53 +547,171 @@ class DataManager:
         with h5py.File(filepath, 'r') as f:
             # Load data
             data = {
-                'joint_positions': f['joint_positions'][:],
+                'joint_positions': self._read_trajectory(f['joint_positions']),
                 'timestamps': f['timestamps'][:],
             }
             
             # Load velocities if available
             if 'joint_velocities' in f:
-                data['joint_velocities'] = f['joint_velocities'][:]
+                data['joint_velocities'] = self._read_trajectory(f['joint_velocities'])
+            
+            # Expand run-length encoded positions back to every frame
+            # (velocities are already stored for every frame)
+            if 'rle_keep_indices' in f:
+                keep = f['rle_keep_indices'][:]
+                timestamps = f['rle_frame_timestamps'][:]
+                source = np.searchsorted(keep, np.arange(len(timestamps)), side='right') - 1
+                data['timestamps'] = timestamps
+                data['joint_positions'] = data['joint_positions'][source]
             
             # Load metadata
-            metadata = {}
-            for key in f.attrs.keys():
-                metadata[key] = f.attrs[key]
-            data['metadata'] = metadata
+            data['metadata'] = _read_metadata(f)
         
         return data
     
+    def load_episode_metadata(self, filepath: str) -> Dict[str, Any]:
+        """
+        Load only an episode's metadata, without reading any trajectory data.
+        
+        Args:
+            filepath: Path to episode file
+            
+        Returns:
+            Dictionary of metadata
+        """
+        filepath = Path(filepath)
+        if not filepath.exists():
+            raise FileNotFoundError(f"Episode file not found: {filepath}")
+        
+        with h5py.File(filepath, 'r') as f:
+            return _read_metadata(f)
+    
+    @staticmethod
+    def _read_trajectory(node: Any) -> np.ndarray:
+        """
+        Read a (num_frames, num_joints) trajectory.
+        
+        Handles both the per-joint group layout and single 2-D datasets
+        written by older versions.
+        """
+        if isinstance(node, h5py.Group):
+            columns = [node[str(j)][:] for j in range(len(node))]
+            return np.stack(columns, axis=1)
+        return node[:]
+    
     def list_episodes(self) -> List[Dict[str, Any]]:
         """
         List all available episodes with metadata.
         
+        Summaries come from the sidecar index. Episode files missing from the
+        index (e.g. copied in by hand) or changed since they were indexed are
+        read again. Files that can't be read are recorded as such and skipped
+        until they change.
+        
         Returns:
             List of dictionaries containing episode info
         """
+        files = sorted(self.episodes_dir.glob("*.h5"))
+        index = self._read_index()
+        
+        if index is None or not self._index_is_current(index, files):
+            index = self._rebuild_index(files)
+        
         episodes = []
+        for filepath in files:
+            summary = index.get(filepath.name)
+            if summary is not None and 'error' not in summary:
+                info = {'filepath': str(filepath), 'filename': filepath.name}
+                info.update(summary)
+                info.pop('stat', None)
+                episodes.append(info)
         
-        for filepath in sorted(self.episodes_dir.glob("*.h5")):
+        return episodes
+    
+    def _read_index(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Read the sidecar index, or None if it is missing or unreadable"""
+        try:
+            with open(self.episodes_dir / _INDEX_FILENAME, 'rb') as f:
+                return _load_json(f.read())
+        except (OSError, ValueError):
+            return None
+    
+    @contextmanager
+    def _locked_index(self) -> Iterator[Dict[str, Dict[str, Any]]]:
+        """Yield the sidecar index for modification under an exclusive file lock"""
+        # fcntl is POSIX-only; elsewhere the index is updated without a lock
+        try:
+            import fcntl
+        except ImportError:
+            fcntl = None
+        
+        with open(self.episodes_dir / _INDEX_LOCK_FILENAME, 'w') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                index = self._read_index() or {}
+                yield index
+                
+                # Write atomically so readers never see a partial index
+                _write_atomic(self.episodes_dir / _INDEX_FILENAME, _dump_json(index))
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+    
+    def _index_episode(self, filepath: Path, metadata: Dict[str, Any]):
+        """Add or update an episode's summary in the sidecar index"""
+        filepath = Path(filepath)
+        with self._locked_index() as index:
+            summary = _episode_summary(metadata)
+            summary['stat'] = _file_stat(filepath)
+            index[filepath.name] = summary
+    
+    @staticmethod
+    def _index_is_current(index: Dict[str, Dict[str, Any]], files: List[Path]) -> bool:
+        """Whether the index covers exactly these files, none changed since indexing"""
+        if index.keys() != {filepath.name for filepath in files}:
+            return False
+        
+        for filepath in files:
+            if index[filepath.name].get('stat') != _file_stat(filepath):
+                return False
+        return True
+    
+    def _rebuild_index(self, files: List[Path]) -> Dict[str, Dict[str, Any]]:
+        """Sync the sidecar index with the episode files on disk"""
+        index = None
+        try:
+            with self._locked_index() as index:
+                self._sync_index(index, files)
+        except OSError:
+            # Read-only episodes directory: use the synced index without persisting it
+            if index is None:
+                index = self._read_index() or {}
+                self._sync_index(index, files)
+        
+        return index
+    
+    @staticmethod
+    def _sync_index(index: Dict[str, Dict[str, Any]], files: List[Path]):
+        """Drop index entries for deleted files and read summaries of new or changed ones"""
+        names = {filepath.name for filepath in files}
+        for name in list(index):
+            if name not in names:
+                del index[name]
+        
+        for filepath in files:
+            summary = index.get(filepath.name)
+            stat = _file_stat(filepath)
+            if summary is not None and summary.get('stat') == stat:
+                continue
             try:
                 with h5py.File(filepath, 'r') as f:
-                    info = {
-                        'filepath': str(filepath),
-                        'filename': filepath.name,
-                        'episode_id': f.attrs.get('episode_id', 'unknown'),
-                        'num_frames': f.attrs.get('num_frames', 0),
-                        'duration': f.attrs.get('duration', 0.0),
-                        'frequency': f.attrs.get('frequency', 0.0),
-                        'timestamp': f.attrs.get('timestamp', 'unknown'),
-                    }
-                    
-                    # Add description if available
-                    if 'description' in f.attrs:
-                        info['description'] = f.attrs['description']
-                    
-                    episodes.append(info)
+                    summary = _episode_summary(_read_metadata(f))
             except Exception as e:
                 print(f"Warning: Could not read {filepath}: {e}")
-        
-        return episodes
+                summary = {'error': str(e)}
+            summary['stat'] = stat
+            index[filepath.name] = summary
     
     def save_calibration(self, joint_limits: Dict[str, Dict[str, float]], 
                         filepath: str = "config/joint_limits.json"):
@@ -180,8 +731,8 @@ class DataManager:
             "joints": joint_limits
         }
         
-        with open(filepath, 'w') as f:
-            json.dump(calibration_data, f, indent=2)
+        # Atomic so an interrupted save can't leave a truncated calibration
+        _write_atomic(filepath, _dump_json(calibration_data, indent=True))
         
         print(f"Calibration saved: {filepath}")
     
@@ -200,8 +751,8 @@ class DataManager:
         if not filepath.exists():
             return None
         
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        with open(filepath, 'rb') as f:
+            data = _load_json(f.read())
         
         return data
     
@@ -213,9 +764,15 @@ class DataManager:
             filepath: Path to episode file to delete
         """
         filepath = Path(filepath)
-        if filepath.exists():
+        # unlink() reports a missing file itself; no separate exists() stat
+        try:
             filepath.unlink()
-            print(f"Deleted episode: {filepath}")
-        else:
+        except FileNotFoundError:
             print(f"Episode not found: {filepath}")
+            return
+        
+        if filepath.parent.resolve() == self.episodes_dir.resolve():
+            with self._locked_index() as index:
+                index.pop(filepath.name, None)
+        print(f"Deleted episode: {filepath}")
 
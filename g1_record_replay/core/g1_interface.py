@@ -1,9 +1,13 @@
 """G1 Robot Interface - Low-level SDK wrapper for motor control"""
 
 from __future__ import annotations
+import os
 import time
+import threading
 import numpy as np
-from typing import Optional, Dict, Any, TYPE_CHECKING
+from itertools import chain
+from operator import attrgetter
+from typing import Optional, Dict, Any, Final, TYPE_CHECKING
 from dataclasses import dataclass
 
 # Import SDK types for type checking only
@@ -29,7 +33,39 @@ except ImportError as e:
     LowState_Runtime = None
 
 
-G1_NUM_MOTOR = 29
+G1_NUM_MOTOR: Final = 29
+
+# C-level field getters for MotorState_ messages
+_get_q = attrgetter('q')
+_get_dq = attrgetter('dq')
+_get_tau_est = attrgetter('tau_est')
+
+
+def _zero_motor_cmds(low_cmd, joint_indices):
+    """Disable the given motors in a LowCmd message (mode 0, zero targets and gains)"""
+    motor_cmd = low_cmd.motor_cmd
+    for i in joint_indices:
+        m = motor_cmd[i]
+        m.mode = 0  # Disable motor
+        m.q = 0.0
+        m.dq = 0.0
+        m.tau = 0.0
+        m.kp = 0.0
+        m.kd = 0.0
+
+
+def _configure_current_thread(cpu: Optional[int], rt_priority: Optional[int]):
+    """Best-effort CPU pinning and SCHED_FIFO priority for the calling thread"""
+    if cpu is not None:
+        try:
+            os.sched_setaffinity(0, {cpu})
+        except (AttributeError, OSError) as e:
+            print(f"Warning: Failed to pin control thread to CPU {cpu}: {e}")
+    if rt_priority is not None:
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(rt_priority))
+        except (AttributeError, OSError) as e:
+            print(f"Warning: Failed to set SCHED_FIFO priority {rt_priority}: {e}")
 
 
 class G1JointIndex:
@@ -71,8 +107,8 @@ class G1JointIndex:
     RightWristYaw = 28
 
 
-# Human-readable joint names
-JOINT_NAMES = [
+# Human-readable joint names (read-only)
+JOINT_NAMES: Final = (
     "left_hip_pitch",
     "left_hip_roll",
     "left_hip_yaw",
@@ -102,18 +138,18 @@ JOINT_NAMES = [
     "right_wrist_roll",
     "right_wrist_pitch",
     "right_wrist_yaw",
-]
+)
 
-# Joint group definitions
-JOINT_GROUPS = {
-    "legs": list(range(0, 12)),  # indices 0-11
-    "waist": list(range(12, 15)),  # indices 12-14
-    "arms": list(range(15, 29)),  # indices 15-28
-    "all": list(range(29))
+# Joint group definitions (tuples: shared, immutable, returned without copying)
+JOINT_GROUPS: Final = {
+    "legs": tuple(range(0, 12)),  # indices 0-11
+    "waist": tuple(range(12, 15)),  # indices 12-14
+    "arms": tuple(range(15, 29)),  # indices 15-28
+    "all": tuple(range(29))
 }
 
 
-def get_joint_indices(group: str = "all") -> list:
+def get_joint_indices(group: str = "all") -> tuple:
     """
     Get joint indices for a specified group.
     
@@ -121,29 +157,35 @@ def get_joint_indices(group: str = "all") -> list:
         group: Joint group name ('arms', 'legs', 'waist', 'all')
         
     Returns:
-        List of joint indices
+        Tuple of joint indices
     """
     if group not in JOINT_GROUPS:
         raise ValueError(f"Invalid joint group: {group}. Choose from {list(JOINT_GROUPS.keys())}")
     return JOINT_GROUPS[group]
 
 
-# Default control gains
-DEFAULT_KP = [
+# Default control gains (read-only)
+DEFAULT_KP: Final = (
     60, 60, 60, 100, 40, 40,      # legs
     60, 60, 60, 100, 40, 40,      # legs
     60, 40, 40,                   # waist
     40, 40, 40, 40, 40, 40, 40,   # left arm
     40, 40, 40, 40, 40, 40, 40    # right arm
-]
+)
 
-DEFAULT_KD = [
+DEFAULT_KD: Final = (
     1, 1, 1, 2, 1, 1,     # legs
     1, 1, 1, 2, 1, 1,     # legs
     1, 1, 1,              # waist
     1, 1, 1, 1, 1, 1, 1,  # left arm
     1, 1, 1, 1, 1, 1, 1   # right arm 
-]
+)
+
+# Read-only array forms of the default gains, shared by all command sends
+_DEFAULT_KP_ARR = np.ascontiguousarray(DEFAULT_KP, dtype=np.float32)
+_DEFAULT_KP_ARR.setflags(write=False)
+_DEFAULT_KD_ARR = np.ascontiguousarray(DEFAULT_KD, dtype=np.float32)
+_DEFAULT_KD_ARR.setflags(write=False)
 
 
 class Mode:
@@ -154,11 +196,18 @@ class Mode:
 
 @dataclass
 class JointState:
-    """Joint state data"""
-    positions: np.ndarray  # (29,) joint positions in radians
-    velocities: np.ndarray  # (29,) joint velocities in rad/s
-    torques: np.ndarray  # (29,) joint torques
-    timestamp: float  # timestamp in seconds
+    """Joint state data (the three arrays are rows of one (3, 29) block)"""
+    __slots__ = ("positions", "velocities", "torques", "timestamp_ns")
+    
+    positions: np.ndarray  # (29,) float32 joint positions in radians
+    velocities: np.ndarray  # (29,) float32 joint velocities in rad/s
+    torques: np.ndarray  # (29,) float32 joint torques
+    timestamp_ns: int  # time.monotonic_ns() when the state was read
+    
+    @property
+    def timestamp(self) -> float:
+        """Monotonic timestamp in seconds"""
+        return self.timestamp_ns * 1e-9
 
 
 class G1Interface:
@@ -180,6 +229,7 @@ class G1Interface:
         self.use_motion_switcher = use_motion_switcher
         self.num_motors = G1_NUM_MOTOR
         self.control_dt = 0.002  # 2ms
+        self._all_indices = tuple(range(self.num_motors))
         
         # State
         self.low_state: Optional['LowState_'] = None
@@ -188,6 +238,7 @@ class G1Interface:
         self.update_mode_machine = False
         self.is_initialized = False
         self.is_control_active = False
+        self._state_ready = threading.Event()
         
         # SDK objects
         self.msc = None
@@ -196,6 +247,14 @@ class G1Interface:
         self.control_thread = None
         self.crc = None
         
+        # Packed per-motor command rows (q, dq, tau, kp, kd)
+        self._cmd_buf = np.zeros((self.num_motors, 5), dtype=np.float32)
+        
+        # Prebuilt all-passive command (CRC stamped once) and whether low_cmd
+        # still needs zeroing to match the last all-passive command sent
+        self._passive_cmd = None
+        self._low_cmd_reset_pending = False
+        
     def initialize(self):
         """Initialize SDK connection and channels"""
         print(f"Initializing G1 interface...")
@@ -218,13 +277,19 @@ class G1Interface:
             self.msc.SetTimeout(5.0)
             self.msc.Init()
             
-            # Release any existing control mode
+            # Release any existing control mode, polling with a short
+            # exponential backoff so a quick release doesn't cost a full second
             status, result = self.msc.CheckMode()
+            delay = 0.05
+            deadline = time.monotonic() + 10.0
             while result.get('name'):
+                if time.monotonic() > deadline:
+                    raise RuntimeError(f"Failed to release existing mode: {result.get('name')}")
                 print(f"Releasing existing mode: {result.get('name')}")
                 self.msc.ReleaseMode()
+                time.sleep(delay)
+                delay = min(delay * 1.5, 0.5)
                 status, result = self.msc.CheckMode()
-                time.sleep(1)
             
             # Create publisher for commands
             self.lowcmd_publisher = ChannelPublisher("rt/lowcmd", LowCmd_)
@@ -243,11 +308,8 @@ class G1Interface:
         # Wait for first state message
         print("Waiting for robot state...")
         timeout = 10.0
-        start_time = time.time()
-        while self.low_state is None:
-            if time.time() - start_time > timeout:
-                raise TimeoutError("Failed to receive robot state within timeout")
-            time.sleep(0.1)
+        if not self._state_ready.wait(timeout):
+            raise TimeoutError("Failed to receive robot state within timeout")
             
         self.is_initialized = True
         if self.use_motion_switcher:
@@ -262,6 +324,9 @@ class G1Interface:
         if self.use_motion_switcher and not self.update_mode_machine:
             self.mode_machine = self.low_state.mode_machine
             self.update_mode_machine = True
+        
+        if not self._state_ready.is_set():
+            self._state_ready.set()
     
     def get_joint_state(self) -> Optional[JointState]:
         """
@@ -270,20 +335,48 @@ class G1Interface:
         Returns:
             JointState object or None if not available
         """
-        if self.low_state is None:
+        low_state = self.low_state
+        if low_state is None:
             return None
-            
-        positions = np.array([self.low_state.motor_state[i].q for i in range(self.num_motors)])
-        velocities = np.array([self.low_state.motor_state[i].dq for i in range(self.num_motors)])
-        torques = np.array([self.low_state.motor_state[i].tau_est for i in range(self.num_motors)])
         
+        # attrgetter + fromiter keep the per-motor field reads and float
+        # conversion in C; all three fields land in one fresh (3, n) block
+        # (callers keep them) and are handed out as row views
+        n = self.num_motors
+        motors = low_state.motor_state[:n]
+        block = np.fromiter(
+            chain(map(_get_q, motors), map(_get_dq, motors), map(_get_tau_est, motors)),
+            dtype=np.float32, count=3 * n
+        ).reshape(3, n)
         return JointState(
-            positions=positions,
-            velocities=velocities,
-            torques=torques,
-            timestamp=time.time()
+            positions=block[0],
+            velocities=block[1],
+            torques=block[2],
+            timestamp_ns=time.monotonic_ns()
         )
     
+    def get_joint_positions_into(self, out: np.ndarray) -> bool:
+        """
+        Copy current joint positions into a caller-supplied buffer.
+        
+        Allocation-free alternative to get_joint_state() for loops that only
+        need positions.
+        
+        Args:
+            out: Buffer of shape (29,) to write positions (radians) into
+            
+        Returns:
+            True if state was available and copied, False otherwise
+        """
+        low_state = self.low_state
+        if low_state is None:
+            return False
+        
+        motor_state = low_state.motor_state
+        for i in range(self.num_motors):
+            out[i] = motor_state[i].q
+        return True
+    
     def set_passive_mode(self, joint_indices: Optional[list] = None, continuous: bool = False):
         """
         Set motors to passive mode (zero torque, free movement).
@@ -303,12 +396,14 @@ class G1Interface:
             raise RuntimeError("Motion switcher not enabled. Initialize with use_motion_switcher=True")
         
         if joint_indices is None:
-            joint_indices = list(range(self.num_motors))
             if not continuous:
                 print("Setting all motors to passive mode...")
-        else:
-            if not continuous:
-                print(f"Setting {len(joint_indices)} motors to passive mode...")
+            self._publish_passive_cmd()
+            return
+        
+        if not continuous:
+            print(f"Setting {len(joint_indices)} motors to passive mode...")
+        self._sync_low_cmd()
             
         # Set specified motors to disabled with zero gains
         # mode=0: Disable motor control
@@ -316,18 +411,31 @@ class G1Interface:
         # tau=0: Zero feedforward torque
         self.low_cmd.mode_pr = Mode.PR
         self.low_cmd.mode_machine = self.mode_machine
-        
-        for i in joint_indices:
-            self.low_cmd.motor_cmd[i].mode = 0  # Disable motor
-            self.low_cmd.motor_cmd[i].q = 0.0
-            self.low_cmd.motor_cmd[i].dq = 0.0
-            self.low_cmd.motor_cmd[i].tau = 0.0
-            self.low_cmd.motor_cmd[i].kp = 0.0
-            self.low_cmd.motor_cmd[i].kd = 0.0
+        _zero_motor_cmds(self.low_cmd, joint_indices)
         
         # Send command
-        self.low_cmd.crc = self.crc.Crc(self.low_cmd)
-        self.lowcmd_publisher.Write(self.low_cmd)
+        self._publish_low_cmd()
+    
+    def _publish_passive_cmd(self):
+        """Publish the prebuilt all-passive command, rebuilding it only if mode_machine changed"""
+        passive_cmd = self._passive_cmd
+        if passive_cmd is None or passive_cmd.mode_machine != self.mode_machine:
+            passive_cmd = unitree_hg_msg_dds__LowCmd_()
+            passive_cmd.mode_pr = Mode.PR
+            passive_cmd.mode_machine = self.mode_machine
+            _zero_motor_cmds(passive_cmd, self._all_indices)
+            passive_cmd.crc = self.crc.Crc(passive_cmd)
+            self._passive_cmd = passive_cmd
+        self.lowcmd_publisher.Write(passive_cmd)
+        # low_cmd itself was not touched; zero it before it is next published
+        # so later partial commands don't resend stale active motors
+        self._low_cmd_reset_pending = True
+    
+    def _sync_low_cmd(self):
+        """Apply a pending all-passive reset to low_cmd"""
+        if self._low_cmd_reset_pending:
+            _zero_motor_cmds(self.low_cmd, self._all_indices)
+            self._low_cmd_reset_pending = False
     
     def send_joint_commands(self, 
                            positions: np.ndarray,
@@ -356,51 +464,90 @@ class G1Interface:
         if len(positions) != self.num_motors:
             raise ValueError(f"Expected {self.num_motors} positions, got {len(positions)}")
         
-        # Use defaults if not provided
-        if kp is None:
-            kp = np.array(DEFAULT_KP)
-        if kd is None:
-            kd = np.array(DEFAULT_KD)
-        if velocities is None:
-            velocities = np.zeros(self.num_motors)
-        if torques is None:
-            torques = np.zeros(self.num_motors)
-        
-        # Determine which joints to command
-        if joint_indices is None:
-            joint_indices = list(range(self.num_motors))
+        # Pack all command fields in one go (defaults if not provided) and convert
+        # to Python floats once, instead of casting each field per joint
+        cmd = self._cmd_buf
+        cmd[:, 0] = positions
+        cmd[:, 1] = 0.0 if velocities is None else velocities
+        cmd[:, 2] = 0.0 if torques is None else torques
+        cmd[:, 3] = _DEFAULT_KP_ARR if kp is None else kp
+        cmd[:, 4] = _DEFAULT_KD_ARR if kd is None else kd
+        rows = cmd.tolist()
         
         # Set command
+        self._sync_low_cmd()
         self.low_cmd.mode_pr = Mode.PR
         self.low_cmd.mode_machine = self.mode_machine
         
-        for i in joint_indices:
-            self.low_cmd.motor_cmd[i].mode = 1  # Enable
-            self.low_cmd.motor_cmd[i].q = float(positions[i])
-            self.low_cmd.motor_cmd[i].dq = float(velocities[i])
-            self.low_cmd.motor_cmd[i].tau = float(torques[i])
-            self.low_cmd.motor_cmd[i].kp = float(kp[i])
-            self.low_cmd.motor_cmd[i].kd = float(kd[i])
+        motor_cmd = self.low_cmd.motor_cmd
+        if joint_indices is None:
+            # All joints: walk motors and rows together, no per-joint indexing
+            # (zip stops after the num_motors command rows)
+            for m, (q, dq, tau, kp_i, kd_i) in zip(motor_cmd, rows):
+                m.mode = 1  # Enable
+                m.q = q
+                m.dq = dq
+                m.tau = tau
+                m.kp = kp_i
+                m.kd = kd_i
+        else:
+            for i in joint_indices:
+                q, dq, tau, kp_i, kd_i = rows[i]
+                m = motor_cmd[i]
+                m.mode = 1  # Enable
+                m.q = q
+                m.dq = dq
+                m.tau = tau
+                m.kp = kp_i
+                m.kd = kd_i
         
         # Send command
-        self.low_cmd.crc = self.crc.Crc(self.low_cmd)
-        self.lowcmd_publisher.Write(self.low_cmd)
+        self._publish_low_cmd()
+    
+    def _publish_low_cmd(self):
+        """Stamp the CRC on the current low_cmd and publish it"""
+        # The SDK's CRC already runs its CRC32 core in a prebuilt C library
+        # (via ctypes), so only the message packing happens in Python
+        low_cmd = self.low_cmd
+        low_cmd.crc = self.crc.Crc(low_cmd)
+        self.lowcmd_publisher.Write(low_cmd)
     
-    def start_control_loop(self, control_function, frequency: float = 500.0):
+    def start_control_loop(self, control_function, frequency: float = 500.0,
+                           cpu_affinity: Optional[int] = None,
+                           rt_priority: Optional[int] = None):
         """
         Start a control loop at specified frequency.
         
         Args:
             control_function: Function to call each iteration (takes no args)
             frequency: Control loop frequency in Hz
+            cpu_affinity: CPU to pin the control thread to (optional, Linux only)
+            rt_priority: SCHED_FIFO priority (1-99) for the control thread
+                         (optional, Linux only, needs CAP_SYS_NICE or root)
         """
         if self.is_control_active:
             raise RuntimeError("Control loop already active")
         
+        if cpu_affinity is not None or rt_priority is not None:
+            # Scheduling calls with pid 0 apply to the calling thread, so they
+            # have to run from inside the control thread on its first tick
+            configured = False
+            
+            def _configured_target():
+                nonlocal configured
+                if not configured:
+                    configured = True
+                    _configure_current_thread(cpu_affinity, rt_priority)
+                control_function()
+            
+            target = _configured_target
+        else:
+            target = control_function
+        
         interval = 1.0 / frequency
         self.control_thread = RecurrentThread(
             interval=interval,
-            target=control_function,
+            target=target,
             name="g1_control"
         )
         self.control_thread.Start()
@@ -2,8 +2,11 @@
 
 import time
 import numpy as np
-from typing import Optional, List
+from typing import Optional
 import sys
+import termios
+import traceback
+import tty
 import select
 
 from rich.console import Console
@@ -11,10 +14,14 @@ from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
 from rich.table import Table
 
-from .core import G1Interface, DataManager, get_joint_indices, JOINT_NAMES
+from .core import G1Interface, DataManager, EpisodeWriter, get_joint_indices, JOINT_NAMES
 from .safety import SafetyChecker
 
 
+# One console for the module; Console() probes the terminal on construction
+_console = Console()
+
+
 class Recorder:
     """Handles trajectory recording with passive motors"""
     
@@ -38,16 +45,34 @@ class Recorder:
         self.episode_name = episode_name
         self.joint_group = joint_group
         self.joint_indices = get_joint_indices(joint_group)
+        self._joint_idx_arr = np.asarray(self.joint_indices, dtype=np.intp)
+        self._joint_names = [JOINT_NAMES[i] for i in self.joint_indices]
         self.show_positions = show_positions
-        self.console = Console()
+        self.console = _console
         
-        # Recording data
-        self.joint_positions: List[np.ndarray] = []
-        self.joint_velocities: List[np.ndarray] = []
-        self.timestamps: List[float] = []
+        # Frames are streamed to the episode file as they are recorded, so
+        # memory use doesn't grow with recording length
+        self.writer: Optional[EpisodeWriter] = None
+        self.num_frames = 0
+        self.last_positions = None
         
         self.running = False
         self.start_time = None
+        self.start_ns = 0
+        self.last_position_print = 0
+    
+    def reset(self, episode_name: Optional[str] = None):
+        """
+        Discard the current take so the recorder can be reused for another one.
+        
+        Args:
+            episode_name: New name for the next episode (keeps the current one if None)
+        """
+        if episode_name is not None:
+            self.episode_name = episode_name
+        self._discard_recording()
+        self.num_frames = 0
+        self.last_positions = None
         self.last_position_print = 0
     
     def _check_keyboard_input(self) -> Optional[str]:
@@ -67,9 +92,31 @@ class Recorder:
         # This reduces any residual resistance by ensuring zero torque at each cycle
         self.interface.set_passive_mode(joint_indices=self.joint_indices, continuous=True)
         
-        self.joint_positions.append(state.positions.copy())
-        self.joint_velocities.append(state.velocities.copy())
-        self.timestamps.append(time.time() - self.start_time)
+        self.writer.append(state.positions, (state.timestamp_ns - self.start_ns) * 1e-9,
+                           state.velocities)
+        self.last_positions = state.positions
+        self.num_frames += 1
+    
+    def _open_writer(self):
+        """Create the episode file that frames are streamed into"""
+        metadata = {
+            'joint_group': self.joint_group,
+            'joint_indices': self.joint_indices
+        }
+        if self.episode_name:
+            metadata['description'] = self.episode_name
+        
+        self.writer = self.data_manager.open_episode_writer(
+            metadata=metadata,
+            episode_name=self.episode_name
+        )
+        self.writer.open()
+    
+    def _discard_recording(self):
+        """Delete the partially written episode file, if any"""
+        if self.writer is not None:
+            self.writer.abort()
+            self.writer = None
     
     def _print_joint_positions(self, positions: np.ndarray):
         """Print current joint positions in a nice format"""
@@ -87,18 +134,18 @@ class Recorder:
         table.add_column("Position (rad)", justify="right", style="green")
         table.add_column("Position (deg)", justify="right", style="yellow")
         
-        # Display only the joints in the selected group
-        for idx in self.joint_indices:
-            joint_name = JOINT_NAMES[idx]
-            pos_rad = positions[idx]
-            pos_deg = np.rad2deg(pos_rad)
+        # Display only the joints in the selected group (one gather and one
+        # degree conversion for all rows)
+        group_rad = positions[self._joint_idx_arr]
+        group_deg = np.rad2deg(group_rad)
+        for joint_name, pos_rad, pos_deg in zip(self._joint_names, group_rad.tolist(), group_deg.tolist()):
             table.add_row(joint_name, f"{pos_rad:+7.4f}", f"{pos_deg:+7.2f}°")
         
         # Clear previous output and print new table
         self.console.clear()
         self.console.print(table)
-        self.console.print(f"\n[bold cyan]Recording... Frames: {len(self.timestamps)}, "
-                          f"Duration: {time.time() - self.start_time:.1f}s[/bold cyan]")
+        self.console.print(f"\n[bold cyan]Recording... Frames: {self.num_frames}, "
+                          f"Duration: {current_time - self.start_time:.1f}s[/bold cyan]")
         self.console.print("[bold]Press 'S' to stop and save, 'C' to cancel[/bold]\n")
     
     def run(self):
@@ -114,12 +161,13 @@ class Recorder:
         self.console.print(f"[bold cyan]Motors ({self.joint_group}) are now passive. You can freely move them.[/bold cyan]")
         self.console.print("[bold]Press 'S' to stop and save, 'C' to cancel[/bold]\n")
         
+        self.reset()
+        self._open_writer()
         self.running = True
         self.start_time = time.time()
+        self.start_ns = time.monotonic_ns()
         
         # Set terminal to non-blocking mode
-        import tty
-        import termios
         old_settings = termios.tcgetattr(sys.stdin)
         
         try:
@@ -140,8 +188,8 @@ class Recorder:
                         next_frame_time += interval
                         
                         # Print joint positions
-                        if len(self.joint_positions) > 0:
-                            self._print_joint_positions(self.joint_positions[-1])
+                        if self.last_positions is not None:
+                            self._print_joint_positions(self.last_positions)
                     
                     # Check for keyboard input
                     key = self._check_keyboard_input()
@@ -151,6 +199,7 @@ class Recorder:
                         self.running = False
                     elif key == 'c':
                         self.console.print("\n[yellow]Canceling without saving...[/yellow]")
+                        self._discard_recording()
                         self.running = False
                     
                     # Small sleep to prevent busy waiting
@@ -181,8 +230,8 @@ class Recorder:
                             next_frame_time += interval
                             
                             # Update progress display
-                            elapsed = time.time() - self.start_time
-                            num_frames = len(self.timestamps)
+                            elapsed = current_time - self.start_time
+                            num_frames = self.num_frames
                             actual_freq = num_frames / elapsed if elapsed > 0 else 0
                             
                             progress.update(
@@ -200,50 +249,38 @@ class Recorder:
                             self.running = False
                         elif key == 'c':
                             self.console.print("\n[yellow]Canceling without saving...[/yellow]")
+                            self._discard_recording()
                             self.running = False
                         
                         # Small sleep to prevent busy waiting
                         time.sleep(0.001)
         
         finally:
+            # A take that wasn't saved (e.g. interrupted) leaves no episode behind
+            self._discard_recording()
+            
             # Restore terminal settings
             termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
             self.console.print("\n[bold green]Recording mode ended[/bold green]")
     
     def _save_recording(self):
-        """Save recorded data to file"""
-        if len(self.timestamps) == 0:
+        """Finish the streamed episode file"""
+        if self.num_frames == 0:
             self.console.print("[red]No data recorded![/red]")
+            self._discard_recording()
             return
         
         self.console.print("\n[bold cyan]Saving episode...[/bold cyan]")
         
-        # Convert lists to arrays
-        joint_positions = np.array(self.joint_positions)
-        joint_velocities = np.array(self.joint_velocities)
-        timestamps = np.array(self.timestamps)
-        
-        # Prepare metadata
-        metadata = {
-            'joint_group': self.joint_group,
-            'joint_indices': self.joint_indices
-        }
-        if self.episode_name:
-            metadata['description'] = self.episode_name
-        
-        # Save episode
+        writer = self.writer
+        self.writer = None
         try:
-            filepath = self.data_manager.save_episode(
-                joint_positions=joint_positions,
-                timestamps=timestamps,
-                joint_velocities=joint_velocities,
-                metadata=metadata,
-                episode_name=self.episode_name
-            )
-            self.console.print(f"[bold green]✓ Episode saved: {filepath}[/bold green]")
+            writer.close()
+            self.console.print(f"[bold green]✓ Episode saved: {writer.filepath}[/bold green]")
+            self.console.print(f"  Frames: {writer.num_frames}, Duration: {writer.duration:.2f}s, "
+                               f"Freq: {writer.frequency:.1f}Hz")
         except Exception as e:
             self.console.print(f"[bold red]Error saving episode: {e}[/bold red]")
-            import traceback
             traceback.print_exc()
 
 
@@ -264,7 +301,7 @@ def run_recording(network_interface: Optional[str] = None,
         show_positions: Whether to display joint positions in real-time
         skip_safety: Skip safety checks (NOT RECOMMENDED - for testing only)
     """
-    console = Console()
+    console = _console
     
     # Safety check
     if not skip_safety:
@@ -292,7 +329,6 @@ def run_recording(network_interface: Optional[str] = None,
         console.print("\n[yellow]Interrupted by user[/yellow]")
     except Exception as e:
         console.print(f"[bold red]Error: {e}[/bold red]")
-        import traceback
         traceback.print_exc()
     finally:
         if 'interface' in locals():
@@ -1,9 +1,14 @@
 """Replay Mode - Execute recorded trajectories on the robot"""
 
+import ctypes
+import errno
 import time
 import numpy as np
 from typing import Optional
 import sys
+import termios
+import traceback
+import tty
 import select
 
 from rich.console import Console
@@ -14,6 +19,109 @@ from .core import G1Interface, DataManager, get_joint_indices
 from .safety import SafetyChecker
 
 
+# One console for the module; Console() probes the terminal on construction
+_console = Console()
+
+
+# Absolute-deadline sleeps via clock_nanosleep(CLOCK_MONOTONIC, TIMER_ABSTIME).
+# Only used where perf_counter is CLOCK_MONOTONIC (Linux), so perf_counter
+# deadlines can be handed to the kernel as-is
+_CLOCK_MONOTONIC = 1
+_TIMER_ABSTIME = 1
+_PR_SET_TIMERSLACK = 29
+_PR_GET_TIMERSLACK = 30
+
+
+class _Timespec(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+
+try:
+    _libc = ctypes.CDLL(None, use_errno=True)
+    _clock_nanosleep = _libc.clock_nanosleep
+    _clock_nanosleep.argtypes = [ctypes.c_int, ctypes.c_int,
+                                 ctypes.POINTER(_Timespec), ctypes.POINTER(_Timespec)]
+    if time.get_clock_info('perf_counter').implementation != 'clock_gettime(CLOCK_MONOTONIC)':
+        _clock_nanosleep = None
+except (OSError, AttributeError):
+    _libc = None
+    _clock_nanosleep = None
+
+
+def _sleep_until(deadline: float):
+    """
+    Sleep until an absolute time.perf_counter() deadline.
+    
+    Args:
+        deadline: Wake-up time in perf_counter seconds
+    """
+    if _clock_nanosleep is not None:
+        sec = int(deadline)
+        ts = _Timespec(sec, int((deadline - sec) * 1e9))
+        # Returns the error number directly; restart if a signal interrupted it
+        err = _clock_nanosleep(_CLOCK_MONOTONIC, _TIMER_ABSTIME, ctypes.byref(ts), None)
+        while err == errno.EINTR:
+            err = _clock_nanosleep(_CLOCK_MONOTONIC, _TIMER_ABSTIME, ctypes.byref(ts), None)
+        if err == 0:
+            return
+        # Any other error returns without sleeping; fall through to time.sleep
+        # so the caller's loop doesn't spin
+    remaining = deadline - time.perf_counter()
+    if remaining > 0:
+        time.sleep(remaining)
+
+
+def _reduce_timer_slack() -> Optional[int]:
+    """
+    Best-effort: shrink the calling thread's timer slack to 1ns (Linux).
+    
+    Returns:
+        Previous timer slack in ns for _restore_timer_slack, or None if unchanged
+    """
+    if _libc is not None and sys.platform.startswith('linux'):
+        try:
+            previous = _libc.prctl(_PR_GET_TIMERSLACK, 0, 0, 0, 0)
+            if previous > 0 and _libc.prctl(_PR_SET_TIMERSLACK, 1, 0, 0, 0) == 0:
+                return previous
+        except AttributeError:
+            pass
+    return None
+
+
+def _restore_timer_slack(previous: Optional[int]):
+    """Restore a timer slack returned by _reduce_timer_slack"""
+    if previous is not None:
+        _libc.prctl(_PR_SET_TIMERSLACK, previous, 0, 0, 0)
+
+
+class _ControlRate:
+    """
+    Drift-free fixed-period pacing.
+    
+    Sleeps to absolute perf_counter deadlines instead of a fixed sleep after
+    each tick, so tick work and sleep overshoot don't accumulate. If a tick
+    overruns by more than a full period, the missed ticks are dropped rather
+    than replayed back to back.
+    """
+    
+    def __init__(self, period: float):
+        self.period = period
+        self.reset()
+    
+    def reset(self):
+        """Restart the schedule from now"""
+        self.next_t = time.perf_counter() + self.period
+    
+    def sleep(self):
+        """Sleep until the next tick's deadline"""
+        now = time.perf_counter()
+        if now < self.next_t:
+            _sleep_until(self.next_t)
+        elif now - self.next_t > self.period:
+            self.next_t = now
+        self.next_t += self.period
+
+
 class Replayer:
     """Handles trajectory replay with safety features"""
     
@@ -35,16 +143,26 @@ class Replayer:
         self.episode_path = episode_path
         self.playback_speed = np.clip(playback_speed, 0.25, 2.0)
         self.transition_duration = transition_duration
-        self.console = Console()
+        self.console = _console
         
         # Load episode data
         self.console.print(f"[cyan]Loading episode: {episode_path}[/cyan]")
         self.episode_data = self.data_manager.load_episode(episode_path)
         
-        self.joint_positions = self.episode_data['joint_positions']
+        # Episodes saved before trajectories were stored as float32 still load
+        # as float64; servo targets only need float32. Timestamps stay float64
+        self.joint_positions = self.episode_data['joint_positions'].astype(np.float32, copy=False)
         self.timestamps = self.episode_data['timestamps']
         self.metadata = self.episode_data['metadata']
         
+        # Per-segment interpolation coefficients, computed once: the position
+        # slope (rad/s) between each pair of frames, zero where timestamps
+        # repeat. Playback then only does one multiply-add per tick
+        dt = np.diff(self.timestamps)
+        inv_dt = np.divide(1.0, dt, out=np.zeros_like(dt), where=dt > 0)
+        self._slopes = (np.diff(self.joint_positions, axis=0) * inv_dt[:, None]).astype(np.float32)
+        self._target_buf = np.empty(self.joint_positions.shape[1], dtype=np.float32)
+        
         # Get joint group/indices from metadata
         self.joint_group = self.metadata.get('joint_group', 'all')
         self.joint_indices = self.metadata.get('joint_indices', None)
@@ -58,6 +176,7 @@ class Replayer:
         self.start_time = None
         self.pause_time = 0.0
         self.accumulated_pause_time = 0.0
+        self._frame_cursor = 0  # start frame of the current interpolation segment
         
         # Print episode info
         self._print_episode_info()
@@ -92,22 +211,29 @@ class Replayer:
         """
         self.console.print(f"[yellow]Transitioning to start position ({self.transition_duration}s)...[/yellow]")
         
-        start_time = time.time()
+        # Precompute the whole cosine-eased trajectory at the control rate;
+        # the loop only picks the row for the current elapsed time
+        control_hz = 500.0
+        num_steps = max(1, int(self.transition_duration * control_hz))
+        ratio = np.arange(num_steps, dtype=np.float32) / np.float32(num_steps)
+        smooth_ratio = (1 - np.cos(ratio * np.float32(np.pi))) / 2
+        delta = np.subtract(target_pos, start_pos, dtype=np.float32)
+        trajectory = np.multiply.outer(smooth_ratio, delta)
+        trajectory += start_pos
         
-        while time.time() - start_time < self.transition_duration:
-            elapsed = time.time() - start_time
-            ratio = elapsed / self.transition_duration
-            
-            # Smooth interpolation using cosine
-            smooth_ratio = (1 - np.cos(ratio * np.pi)) / 2
-            
-            # Interpolate positions
-            current_target = start_pos + (target_pos - start_pos) * smooth_ratio
+        rate = _ControlRate(1.0 / control_hz)
+        start_time = time.perf_counter()
+        
+        while True:
+            elapsed = time.perf_counter() - start_time
+            if elapsed >= self.transition_duration:
+                break
+            step = min(int(elapsed * control_hz), num_steps - 1)
             
             # Send command (only for specified joints)
-            self.interface.send_joint_commands(current_target, joint_indices=self.joint_indices)
+            self.interface.send_joint_commands(trajectory[step], joint_indices=self.joint_indices)
             
-            time.sleep(0.002)  # 500Hz control
+            rate.sleep()  # 500Hz control
         
         # Send final target position
         self.interface.send_joint_commands(target_pos, joint_indices=self.joint_indices)
@@ -121,33 +247,35 @@ class Replayer:
             playback_time: Time in playback (seconds)
             
         Returns:
-            Target joint positions or None if playback finished
+            Target joint positions or None if playback finished. Interpolated
+            targets are written into a buffer reused by the next call.
         """
+        timestamps = self.timestamps
+        positions = self.joint_positions
+        
         # Find appropriate frame
-        if playback_time < 0:
-            return self.joint_positions[0]
+        if playback_time < 0 or playback_time <= timestamps[0]:
+            return positions[0]
         
         # Check if playback finished
-        if playback_time > self.timestamps[-1]:
+        if playback_time > timestamps[-1]:
             return None
         
-        # Find surrounding frames
-        idx = np.searchsorted(self.timestamps, playback_time)
-        
-        if idx == 0:
-            return self.joint_positions[0]
-        
-        if idx >= len(self.timestamps):
-            return self.joint_positions[-1]
-        
-        # Linear interpolation between frames
-        t0 = self.timestamps[idx - 1]
-        t1 = self.timestamps[idx]
-        pos0 = self.joint_positions[idx - 1]
-        pos1 = self.joint_positions[idx]
+        # Playback time only moves forward, so advance a cursor from the last
+        # frame (usually 0-1 steps per tick); bisect only if time went back
+        # (keeps timestamps[idx] < playback_time <= timestamps[idx + 1])
+        idx = self._frame_cursor
+        if timestamps[idx] >= playback_time:
+            idx = int(np.searchsorted(timestamps, playback_time)) - 1
+        while timestamps[idx + 1] < playback_time:
+            idx += 1
+        self._frame_cursor = idx
         
-        alpha = (playback_time - t0) / (t1 - t0) if t1 > t0 else 0.0
-        return pos0 + (pos1 - pos0) * alpha
+        # Linear interpolation between frames, into the reused target buffer
+        target = self._target_buf
+        np.multiply(self._slopes[idx], float(playback_time - timestamps[idx]), out=target)
+        target += positions[idx]
+        return target
     
     def run(self):
         """Run replay mode"""
@@ -159,6 +287,16 @@ class Replayer:
         
         self.console.print("\n[bold green]Starting replay mode...[/bold green]")
         
+        # Tighter wake-ups for the 500Hz deadline sleeps; restored afterwards
+        # so the calling thread isn't left with 1ns slack
+        previous_slack = _reduce_timer_slack()
+        try:
+            self._play()
+        finally:
+            _restore_timer_slack(previous_slack)
+    
+    def _play(self):
+        """Move to the start position, play back the episode and hold the final position"""
         # Get current position
         state = self.interface.get_joint_state()
         if state is None:
@@ -176,12 +314,10 @@ class Replayer:
         
         self.running = True
         self.paused = False
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         self.accumulated_pause_time = 0.0
         
         # Set terminal to non-blocking mode
-        import tty
-        import termios
         old_settings = termios.tcgetattr(sys.stdin)
         
         try:
@@ -199,9 +335,22 @@ class Replayer:
             ) as progress:
                 
                 task = progress.add_task("[cyan]Replaying...", total=100)
+                rate = _ControlRate(0.002)  # 500Hz control
+                
+                # Bind per-tick lookups to locals once
+                clock = time.perf_counter  # same clock as start_time
+                get_target_position = self._get_target_position
+                send_joint_commands = self.interface.send_joint_commands
+                check_keyboard_input = self._check_keyboard_input
+                update_progress = progress.update
+                rate_sleep = rate.sleep
+                joint_indices = self.joint_indices
+                playback_speed = self.playback_speed
+                episode_end = float(self.timestamps[-1])
+                num_frames = len(self.timestamps)
                 
                 while self.running:
-                    current_time = time.time()
+                    current_time = clock()
                     
                     # Handle pause
                     if self.paused:
@@ -215,6 +364,7 @@ class Replayer:
                             self.accumulated_pause_time += current_time - self.pause_time
                             self.pause_time = 0
                             self.paused = False
+                            rate.reset()
                             self.console.print("[green]Resumed[/green]")
                         elif key == 'q':
                             self.console.print("\n[yellow]Quitting...[/yellow]")
@@ -223,10 +373,10 @@ class Replayer:
                     
                     # Calculate playback time
                     elapsed = current_time - self.start_time - self.accumulated_pause_time
-                    playback_time = elapsed * self.playback_speed
+                    playback_time = elapsed * playback_speed
                     
                     # Get target position
-                    target_pos = self._get_target_position(playback_time)
+                    target_pos = get_target_position(playback_time)
                     
                     if target_pos is None:
                         # Playback finished
@@ -235,21 +385,21 @@ class Replayer:
                         break
                     
                     # Send command (only for specified joints)
-                    self.interface.send_joint_commands(target_pos, joint_indices=self.joint_indices)
+                    send_joint_commands(target_pos, joint_indices=joint_indices)
                     
                     # Update progress
-                    progress_pct = min(100, (playback_time / self.timestamps[-1]) * 100)
-                    frame_idx = int((playback_time / self.timestamps[-1]) * len(self.timestamps))
-                    frame_idx = np.clip(frame_idx, 0, len(self.timestamps) - 1)
+                    progress_ratio = playback_time / episode_end
+                    progress_pct = min(100, progress_ratio * 100)
+                    frame_idx = min(max(int(progress_ratio * num_frames), 0), num_frames - 1)
                     
-                    progress.update(
+                    update_progress(
                         task,
                         completed=progress_pct,
-                        description=f"[cyan]Replaying... Frame: {frame_idx}/{len(self.timestamps)}"
+                        description=f"[cyan]Replaying... Frame: {frame_idx}/{num_frames}"
                     )
                     
                     # Check for keyboard input
-                    key = self._check_keyboard_input()
+                    key = check_keyboard_input()
                     if key == 'p':
                         self.paused = True
                         self.console.print("[yellow]Paused[/yellow]")
@@ -257,17 +407,19 @@ class Replayer:
                         self.console.print("\n[yellow]Quitting...[/yellow]")
                         self.running = False
                     
-                    time.sleep(0.002)  # 500Hz control
+                    rate_sleep()
         
         finally:
             # Restore terminal settings
             termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
             
-            # Hold final position briefly
+            # Hold final position briefly (100 ticks at 500Hz), on the same
+            # absolute-deadline pacing as playback
             if target_pos is not None:
+                rate = _ControlRate(0.002)
                 for _ in range(100):
                     self.interface.send_joint_commands(target_pos, joint_indices=self.joint_indices)
-                    time.sleep(0.002)
+                    rate.sleep()
             
             self.console.print("\n[bold green]Replay mode ended[/bold green]")
 
@@ -285,17 +437,17 @@ def run_replay(network_interface: Optional[str] = None,
         playback_speed: Speed multiplier for playback
         skip_safety: Skip safety checks (NOT RECOMMENDED - for testing only)
     """
-    console = Console()
+    console = _console
     
     if not episode_path:
         console.print("[red]Error: Episode path is required[/red]")
         return
     
-    # Load episode metadata to show what will be controlled
+    # Load episode metadata to show what will be controlled (the trajectory
+    # itself is loaded once, by the Replayer)
     try:
         dm = DataManager()
-        episode_data = dm.load_episode(episode_path)
-        joint_group = episode_data['metadata'].get('joint_group', 'all')
+        joint_group = dm.load_episode_metadata(episode_path).get('joint_group', 'all')
     except Exception as e:
         console.print(f"[red]Error loading episode: {e}[/red]")
         return
@@ -328,7 +480,6 @@ def run_replay(network_interface: Optional[str] = None,
         console.print("\n[yellow]Interrupted by user[/yellow]")
     except Exception as e:
         console.print(f"[bold red]Error: {e}[/bold red]")
-        import traceback
         traceback.print_exc()
     finally:
         if 'interface' in locals():
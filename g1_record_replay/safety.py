@@ -13,6 +13,10 @@ except ImportError:
     LOCO_CLIENT_AVAILABLE = False
 
 
+# One console for the module; Console() probes the terminal on construction
+_console = Console()
+
+
 class SafetyChecker:
     """
     Handles safety checks before low-level motor control.
@@ -20,7 +24,7 @@ class SafetyChecker:
     """
     
     def __init__(self):
-        self.console = Console()
+        self.console = _console
         self.loco_client = None
         
     def initialize_loco_client(self) -> bool:
@@ -52,9 +52,8 @@ def check_robot_ping(ip_address, timeout=2):
     try:
         result = subprocess.run(
             ['ping', '-c', '3', '-W', str(timeout), ip_address],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
+            stdout=subprocess.DEVNULL,  # only the exit status is used
+            stderr=subprocess.DEVNULL,
             timeout=timeout + 3
         )
         return result.returncode == 0
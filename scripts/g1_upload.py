@@ -53,7 +53,7 @@ def get_serial_number():
         if os.path.exists("/etc/unitree/serial"):
             with open("/etc/unitree/serial", "r") as f:
                 return f.read().strip()
-    except: pass
+    except (OSError, UnicodeDecodeError): pass
     return "Unknown"
 
 # --- Main Logic ---
@@ -9,12 +9,17 @@ setup(
     install_requires=[
         "numpy>=1.20.0",
         "h5py>=3.0.0",
+        "hdf5plugin>=4.0.0",
         "pyyaml>=5.4.0",
         "rich>=10.0.0",
         "matplotlib>=3.0.0",
         # Note: unitree_sdk2_python must be installed separately
         # cd ../unitree_sdk2_python && uv pip install -e .
     ],
+    extras_require={
+        # Faster JSON for calibration and episode index files
+        "speedups": ["orjson>=3.6.0"],
+    },
     dependency_links=[
         # Local path to unitree SDK
         "file:///../unitree_sdk2_python#egg=unitree_sdk2py",
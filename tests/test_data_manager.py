@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""Test episode storage (no robot needed)"""
+
+import sys
+from pathlib import Path
+
+import h5py
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from g1_record_replay.core import DataManager
+from g1_record_replay.core.data_manager import _stationary_keep_indices
+
+
+def make_episode(num_frames=200, num_joints=29, seed=0):
+    """Smooth random trajectory with matching velocities and 500Hz timestamps"""
+    rng = np.random.default_rng(seed)
+    steps = rng.normal(scale=0.01, size=(num_frames, num_joints))
+    positions = np.cumsum(steps, axis=0)
+    velocities = steps * 500.0
+    timestamps = np.arange(num_frames) * 0.002
+    return positions, velocities, timestamps
+
+
+def make_stationary_episode(num_frames=2000, num_joints=29, seed=0):
+    """Trajectory mixing still stretches, sub-eps drift and real motion"""
+    rng = np.random.default_rng(seed)
+    step_sizes = rng.choice([0.0, 1e-4, 5e-4, 2e-3, 0.05], size=(num_frames, num_joints),
+                            p=[0.6, 0.2, 0.15, 0.04, 0.01])
+    steps = step_sizes * rng.choice([-1.0, 1.0], size=(num_frames, num_joints))
+    return np.cumsum(steps, axis=0).astype(np.float32)
+
+
+def reference_keep_indices(positions, eps):
+    """Brute force: keep a frame when it moved more than eps from its predecessor or the last kept frame"""
+    keep = [0]
+    for i in range(1, len(positions)):
+        if (np.max(np.abs(positions[i] - positions[i - 1])) > eps
+                or np.max(np.abs(positions[i] - positions[keep[-1]])) > eps):
+            keep.append(i)
+    if keep[-1] != len(positions) - 1:
+        keep.append(len(positions) - 1)
+    return np.asarray(keep)
+
+
+def test_round_trip(tmp_path):
+    """Positions, velocities, timestamps and metadata survive save/load"""
+    data_manager = DataManager(str(tmp_path))
+    positions, velocities, timestamps = make_episode()
+
+    filepath = data_manager.save_episode(positions, timestamps, velocities,
+                                         metadata={'description': 'wave', 'joint_indices': [15, 16]},
+                                         episode_name="plain")
+    data = data_manager.load_episode(filepath)
+
+    assert data['joint_positions'].shape == positions.shape
+    assert data['joint_positions'].dtype == np.float32
+    np.testing.assert_allclose(data['joint_positions'], positions, atol=1e-6)
+    np.testing.assert_allclose(data['joint_velocities'], velocities, rtol=1e-6, atol=1e-5)
+    np.testing.assert_array_equal(data['timestamps'], timestamps)
+
+    metadata = data['metadata']
+    assert metadata['num_frames'] == len(timestamps)
+    assert metadata['description'] == 'wave'
+    assert metadata['joint_indices'] == [15, 16]
+    assert data_manager.load_episode_metadata(filepath) == metadata
+
+
+def test_round_trip_without_velocities(tmp_path):
+    """Episodes saved without velocities load without them"""
+    data_manager = DataManager(str(tmp_path))
+    positions, _, timestamps = make_episode()
+
+    filepath = data_manager.save_episode(positions, timestamps, episode_name="no_vel")
+    data = data_manager.load_episode(filepath)
+
+    assert 'joint_velocities' not in data
+    np.testing.assert_allclose(data['joint_positions'], positions, atol=1e-6)
+
+
+def test_on_disk_layout(tmp_path):
+    """Trajectories are stored as one float32 dataset per joint"""
+    data_manager = DataManager(str(tmp_path))
+    positions, velocities, timestamps = make_episode(num_joints=29)
+
+    filepath = data_manager.save_episode(positions, timestamps, velocities, episode_name="layout")
+    with h5py.File(filepath, 'r') as f:
+        for name in ('joint_positions', 'joint_velocities'):
+            assert isinstance(f[name], h5py.Group)
+            assert len(f[name]) == 29
+            assert f[name]['0'].dtype == np.float32
+        assert 'metadata_json' in f.attrs
+        assert f.attrs['num_frames'] == len(timestamps)
+
+
+def test_load_legacy_episode(tmp_path):
+    """2-D gzip datasets with per-key metadata attributes still load"""
+    data_manager = DataManager(str(tmp_path))
+    positions, velocities, timestamps = make_episode()
+
+    filepath = tmp_path / "episode_20240101_000000.h5"
+    with h5py.File(filepath, 'w') as f:
+        f.create_dataset('joint_positions', data=positions, compression='gzip')
+        f.create_dataset('timestamps', data=timestamps, compression='gzip')
+        f.create_dataset('joint_velocities', data=velocities, compression='gzip')
+        f.attrs['episode_id'] = "episode_20240101_000000"
+        f.attrs['num_frames'] = len(timestamps)
+        f.attrs['description'] = "legacy"
+
+    data = data_manager.load_episode(str(filepath))
+
+    np.testing.assert_array_equal(data['joint_positions'], positions)
+    np.testing.assert_array_equal(data['joint_velocities'], velocities)
+    np.testing.assert_array_equal(data['timestamps'], timestamps)
+    assert data['metadata']['description'] == "legacy"
+    assert data['metadata']['num_frames'] == len(timestamps)
+
+
+def test_stationary_keep_indices_matches_reference():
+    """The run-based scan keeps exactly the frames of the sequential definition"""
+    for seed in range(5):
+        positions = make_stationary_episode(num_frames=3000, seed=seed)
+        for eps in (5e-4, 1e-3, 1e-2):
+            np.testing.assert_array_equal(_stationary_keep_indices(positions, eps),
+                                          reference_keep_indices(positions, eps))
+
+
+def test_rle_round_trip(tmp_path):
+    """RLE positions stay within eps of the original; velocities are exact per frame"""
+    data_manager = DataManager(str(tmp_path))
+    eps = 1e-3
+    positions = make_stationary_episode()
+    velocities = np.zeros_like(positions)
+    velocities[::7] = 25.0
+    timestamps = np.arange(len(positions)) * 0.002
+
+    filepath = data_manager.save_episode(positions, timestamps, velocities,
+                                         metadata={'rle_eps': eps}, episode_name="rle")
+    data = data_manager.load_episode(filepath)
+
+    assert data['metadata']['rle_kept_frames'] < len(positions)
+    assert data['metadata']['num_frames'] == len(positions)
+    assert data['joint_positions'].shape == positions.shape
+    assert np.max(np.abs(data['joint_positions'] - positions)) <= eps
+    np.testing.assert_array_equal(data['joint_velocities'], velocities)
+    np.testing.assert_array_equal(data['timestamps'], timestamps)
+
+
+def test_rle_round_trip_without_velocities(tmp_path):
+    """RLE episodes saved without velocities load without them"""
+    data_manager = DataManager(str(tmp_path))
+    positions = make_stationary_episode()
+    timestamps = np.arange(len(positions)) * 0.002
+
+    filepath = data_manager.save_episode(positions, timestamps, metadata={'rle_eps': 1e-3},
+                                         episode_name="rle_no_vel")
+    data = data_manager.load_episode(filepath)
+
+    assert 'joint_velocities' not in data
+    assert data['joint_positions'].shape == positions.shape
+
+
+def test_list_episodes_after_delete(tmp_path):
+    """Deleted episodes disappear from the listing"""
+    data_manager = DataManager(str(tmp_path))
+    positions, _, timestamps = make_episode()
+    first = data_manager.save_episode(positions, timestamps, episode_name="first")
+    second = data_manager.save_episode(positions, timestamps, episode_name="second")
+
+    assert [e['filepath'] for e in data_manager.list_episodes()] == sorted([first, second])
+
+    data_manager.delete_episode(first)
+    assert [e['filepath'] for e in data_manager.list_episodes()] == [second]
+
+    # Files removed behind the data manager's back are dropped as well
+    Path(second).unlink()
+    assert data_manager.list_episodes() == []
+
+
+def test_list_episodes_after_external_overwrite(tmp_path):
+    """An episode file replaced under the same name is re-read, not served from the index"""
+    data_manager = DataManager(str(tmp_path / "episodes"))
+    other = DataManager(str(tmp_path / "other"))
+    positions, _, timestamps = make_episode()
+
+    filepath = data_manager.save_episode(positions, timestamps, metadata={'description': 'old'},
+                                         episode_name="take")
+    assert data_manager.list_episodes()[0]['num_frames'] == len(timestamps)
+
+    replacement = other.save_episode(positions[:50], timestamps[:50], metadata={'description': 'new'},
+                                     episode_name="take")
+    Path(filepath).write_bytes(Path(replacement).read_bytes())
+
+    episodes = data_manager.list_episodes()
+    assert len(episodes) == 1
+    assert episodes[0]['num_frames'] == 50
+    assert episodes[0]['description'] == 'new'
+    assert 'stat' not in episodes[0]
+
+
+def test_list_episodes_skips_unreadable_files(tmp_path):
+    """Broken .h5 files are listed once as unreadable, then skipped until they change"""
+    data_manager = DataManager(str(tmp_path))
+    positions, _, timestamps = make_episode()
+    data_manager.save_episode(positions, timestamps, episode_name="good")
+    (tmp_path / "broken.h5").write_bytes(b"not an hdf5 file")
+
+    assert len(data_manager.list_episodes()) == 1
+    index_mtime = (tmp_path / "_index.json").stat().st_mtime_ns
+    assert len(data_manager.list_episodes()) == 1
+    assert (tmp_path / "_index.json").stat().st_mtime_ns == index_mtime